@@ -14,6 +14,7 @@ from oliver.subcommands import (
     aws,
     azure,
     batches,
+    cache,
     configure,
     config,
     inputs,
@@ -32,6 +33,7 @@ SUBCOMMANDS = {
     "aws": aws,
     "azure": azure,
     "batches": batches,
+    "cache": cache,
     "configure": configure,
     "config": config,
     "inputs": inputs,
@@ -101,7 +103,11 @@ async def run() -> None:
         if not k in args or not args[k]:
             args[k] = v
 
-    if not args.get("force") and args.get("subcommand") not in ["configure", "config"]:
+    if not args.get("force") and args.get("subcommand") not in [
+        "cache",
+        "configure",
+        "config",
+    ]:
         ensure_required_args(args)
 
     if not args.get("subcommand"):
@@ -114,14 +120,10 @@ async def run() -> None:
     elif args.get("debug"):
         logzero.loglevel(logging.DEBUG)
 
-    cromwell = api.CromwellAPI(
+    async with api.CromwellAPI(
         server=args["cromwell_server"], version=args["cromwell_api_version"]
-    )
-
-    try:
+    ) as cromwell:
         await args["func"](args, cromwell)
-    finally:
-        await cromwell.close()
 
 
 def main() -> None:
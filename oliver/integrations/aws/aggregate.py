@@ -77,9 +77,7 @@ async def call(args: Dict[str, Any], cromwell: api.CromwellAPI) -> None:
         _this_output_folder = output_folder
 
         if args.get("append_job_name"):
-            name = oliver.get_oliver_name(
-                await cromwell.get_workflows_metadata(workflow.get("id", ""))
-            )
+            name = oliver.get_oliver_name(workflow)
             if not name or name == "<not set>":
                 name = "__UNKNOWN__"
             _this_output_folder = os.path.join(_this_output_folder, name)
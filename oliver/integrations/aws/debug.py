@@ -10,7 +10,7 @@ from mypy_boto3_batch import BatchClient
 from mypy_boto3_batch.type_defs import DescribeJobsResponseTypeDef
 from mypy_boto3_logs import CloudWatchLogsClient
 
-from ...lib import api, errors, reporting, workflows as _workflows
+from ...lib import api, args as _args, errors, reporting, workflows as _workflows
 
 
 @lru_cache(maxsize=4096)
@@ -116,16 +116,8 @@ def get_aws_batch_jobs(
 async def get_calls_and_times_for_workflows(
     args: Dict[str, Any], cromwell: api.CromwellAPI
 ) -> Tuple[List[Dict[str, Any]], Union[int, float], Union[int, float]]:
-    batches = None
-    relative = None
-
-    if args.get("batches_relative"):
-        batches = args.get("batches_relative")
-        relative = True
-    elif args.get("batches_absolute"):
-        batches = args.get("batches_absolute")
-        relative = False
-    else:
+    batches, relative = _args.get_batches(args)
+    if batches is None:
         errors.report(
             "Neither relative nor absolute batches was given!",
             fatal=True,
@@ -143,9 +135,7 @@ async def get_calls_and_times_for_workflows(
 
     start_time_to_filter_by = None
     end_time_to_filter_by = None
-    metadatas = {
-        w["id"]: await cromwell.get_workflows_metadata(w["id"]) for w in workflows
-    }
+    metadatas = await cromwell.get_workflows_metadata_many([w["id"] for w in workflows])
 
     failed_calls = []
 
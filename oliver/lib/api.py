@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import json
 import os
@@ -10,6 +11,9 @@ import aiohttp
 from . import errors, utils
 
 FILE_PARAMS = ["workflowSource", "workflowDependencies"]
+MAX_CONCURRENT_REQUESTS = 16
+MAX_CONNECTIONS = 32
+KEEPALIVE_TIMEOUT_SECS = 30
 
 
 def remove_none_values(d: Dict[str, Any]) -> Dict[str, Any]:
@@ -36,9 +40,22 @@ class CromwellAPI:
         self.server = server
         self.version = version
         self.headers = headers or {"Accept": "application/json"}
-        self.session = aiohttp.ClientSession()
+        # all requests share one pool of keep-alive connections so that
+        # repeated calls (e.g. fetching metadata for many workflows) don't
+        # pay for a new TCP/TLS handshake each time.
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS, keepalive_timeout=KEEPALIVE_TIMEOUT_SECS
+            )
+        )
         self.route_override = route_override
 
+    async def __aenter__(self) -> "CromwellAPI":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
     async def close(self) -> None:
         await self.session.close()
 
@@ -199,9 +216,77 @@ class CromwellAPI:
         )
         return data
 
-    async def post_workflows_batch(self) -> None:
-        "POST /api/workflows/{version}/batch"
-        raise NotImplementedError()
+    # pylint: disable=too-many-arguments
+    async def post_workflows_batch(
+        self,
+        workflowSource: Optional[str] = None,
+        workflowUrl: Optional[str] = None,
+        workflowInputs: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        workflowOptions: Optional[Dict[str, str]] = None,
+        labels: Optional[Dict[str, str]] = None,
+        workflowDependencies: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """POST /api/workflows/{version}/batch
+
+        Submits one workflow per entry in `workflowInputs`. All of the
+        workflows share the same source, options, labels, and dependencies.
+
+        Args:
+            workflowSource (str, optional): Path to the workflow source file. Defaults to None.
+            workflowUrl (str, optional): URL of the workflow source. Defaults to None.
+            workflowInputs (Union[str, List[Dict]]): JSON array (or list) of inputs, one per workflow.
+            workflowOptions (Dict, optional): Options shared by all workflows. Defaults to None.
+            labels (Dict, optional): Labels shared by all workflows. Defaults to None.
+            workflowDependencies (str, optional): Zip file of workflow dependencies. Defaults to None.
+
+        Returns:
+            List: The id and status of each submitted workflow.
+        """
+
+        if workflowOptions is None:
+            workflowOptions = {}
+        if labels is None:
+            labels = {}
+
+        if workflowSource is None and workflowUrl is None:
+            errors.report(
+                "Expected either 'workflowSource' or 'workflowUrl'!",
+                fatal=True,
+                exitcode=errors.ERROR_INVALID_INPUT,
+            )
+
+        if isinstance(workflowInputs, list):
+            workflowInputs = json.dumps(workflowInputs)
+
+        if not workflowInputs or workflowInputs == "[]":
+            errors.report(
+                "Expected at least one set of 'workflowInputs' for a batch!",
+                fatal=True,
+                exitcode=errors.ERROR_INVALID_INPUT,
+            )
+
+        data = {
+            "workflowSource": workflowSource,
+            "workflowUrl": workflowUrl,
+            "workflowInputs": workflowInputs,
+            "workflowOptions": workflowOptions,
+            "labels": labels,
+            "workflowDependencies": workflowDependencies,
+        }
+
+        logger.debug("workflowSource: %s", workflowSource)
+        logger.debug("workflowUrl: %s", workflowUrl)
+        logger.debug("workflowInputs: %s", workflowInputs)
+        logger.debug("workflowOptions: %s", workflowOptions)
+        logger.debug("labels: %s", labels)
+        logger.debug("workflowDependencies: %s", workflowDependencies)
+
+        _, results = await self._api_call(
+            "api/workflows/{version}/batch",
+            method="POST",
+            data=data,
+        )
+        return cast(List[Dict[str, Any]], results)
 
     async def get_workflows_labels(self) -> None:
         "GET /api/workflows/{version}/{id}/labels"
@@ -300,6 +385,10 @@ class CromwellAPI:
                     fatal=True,
                     exitcode=errors.ERROR_UNEXPECTED_RESPONSE,
                 )
+            elif statuses:
+                # having no workflows in the requested state(s) (e.g. no
+                # failures) is a perfectly valid answer.
+                logger.info("No workflows found with status(es): %s.", statuses)
             else:
                 errors.report(
                     "No results found in response!",
@@ -348,6 +437,43 @@ class CromwellAPI:
         )
         return data
 
+    async def get_workflows_metadata_many(
+        self,
+        ids: List[str],
+        includeKey: Optional[List[str]] = None,
+        excludeKey: Optional[List[str]] = None,
+        expandSubWorkflows: Optional[bool] = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Concurrently GET /api/workflows/{version}/{id}/metadata for many workflows.
+
+        At most `MAX_CONCURRENT_REQUESTS` requests are in flight at any given
+        time so that large queries don't overwhelm the Cromwell server.
+
+        Args:
+            ids (List[str]): Workflow IDs to get metadata from.
+            includeKey (List[str], optional): Keys to include in results. Defaults to None.
+            excludeKey (List[str], optional): Keys to exclude in results. Defaults to None.
+            expandSubWorkflows (bool, optional): Whether to expand subworkflows in results. Defaults to False.
+
+        Returns:
+            Dict: Metadata of the specified workflows indexed by workflow id.
+        """
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        # pylint: disable=redefined-builtin
+        async def fetch(id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_workflows_metadata(
+                    id,
+                    includeKey=includeKey,
+                    excludeKey=excludeKey,
+                    expandSubWorkflows=expandSubWorkflows,
+                )
+
+        metadatas = await asyncio.gather(*[fetch(id) for id in ids])
+        return dict(zip(ids, metadatas))
+
     async def get_workflows_call_caching_diff(self) -> None:
         "GET /api/workflows/{version}/callcaching/diff"
         raise NotImplementedError()
@@ -1,6 +1,6 @@
 import argparse
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 
 def add_version_arg(parser: argparse.ArgumentParser) -> None:
@@ -67,6 +67,18 @@ def add_batches_group(
     )
 
 
+def get_batches(args: Dict[str, Any]) -> Tuple[Optional[List[int]], Optional[bool]]:
+    """Returns the `batches` and `relative_batching` parameters for
+    `workflows.get_workflows` from the arguments added by `add_batches_group`.
+    Both are None if no batches were given."""
+
+    if args.get("batches_relative"):
+        return args["batches_relative"], True
+    if args.get("batches_absolute"):
+        return args["batches_absolute"], False
+    return None, None
+
+
 def add_oliver_job_group_args(parser: argparse.ArgumentParser, **kwargs: Any) -> None:
     _kwargs: Dict[str, Any] = {
         "help": "Specify the Oliver job group.",
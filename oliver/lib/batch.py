@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Collection, Dict, List, Optional, Tuple, Union
 
 import pendulum
 from logzero import logger
@@ -11,6 +11,7 @@ def get_workflow_batches(
     batches: Union[int, List[int], bool],
     batch_interval_mins: Optional[int] = 5,
     relative: Optional[bool] = False,
+    statuses: Optional[Collection[str]] = None,
 ) -> List[Dict[str, Any]]:
     """Returns all workflows where the derived batch number is included in `batches`.
 
@@ -25,17 +26,20 @@ def get_workflow_batches(
         relative(bool): if True, batches will be considered as "N batches ago" (e.g.
                         `0` will return the most recent batch, `1` will return the second
                         most recent batch).
+        statuses (Collection[str], optional): if given, only workflows in one of
+                                              these statuses are returned.
     returns:
-        List[dict]: the `workflows` filtered by batch number.
+        List[dict]: the `workflows` filtered by batch number (and status).
     """
 
     _workflows, _max_batch_num = batch_workflows(
         workflows, batch_interval_mins=batch_interval_mins
     )
+    _statuses = frozenset(statuses or ())
 
     if isinstance(batches, bool) and batches:
         logger.info("Targetting all batches.")
-        return _workflows
+        return [w for w in _workflows if not _statuses or w.get("status") in _statuses]
 
     if isinstance(batches, int):
         batches = [batches]
@@ -44,8 +48,7 @@ def get_workflow_batches(
 
     if relative:
         _batches = [_max_batch_num - b for b in _batches]
-        # pylint: disable=R1729
-        if any([b < 0 for b in _batches]):
+        if any(b < 0 for b in _batches):
             errors.report(
                 message="One of the batch numbers given was higher than the largest batch number, so it does not exist!",
                 fatal=True,
@@ -58,7 +61,12 @@ def get_workflow_batches(
         ", ".join([str(b) for b in batches]),
         relative,
     )
-    return list(filter(lambda w: w.get("batch") in _batches, _workflows))
+    targets = set(_batches)
+    return [
+        w
+        for w in _workflows
+        if w.get("batch") in targets and (not _statuses or w.get("status") in _statuses)
+    ]
 
 
 def batch_workflows(
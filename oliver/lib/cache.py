@@ -0,0 +1,191 @@
+import datetime
+import json
+import os
+import sqlite3
+
+from importlib import metadata as _metadata
+from typing import Any, Dict, List, Optional
+
+from logzero import logger
+
+from . import errors
+
+DEFAULT_LOCATION = "~/.oliver_metadata_cache"
+
+# Stored in the cache file with `PRAGMA user_version`. Cache files with any
+# other version are emptied and recreated, so bump this whenever the layout of
+# the `metadata` table changes.
+#
+#   1: keyed by (workflow id, status).
+#   2: adds `include_keys` to the key.
+SCHEMA_VERSION = 2
+
+# Metadata for workflows in these states will never change, so it is safe to
+# cache it indefinitely.
+TERMINAL_STATUSES = frozenset({"Succeeded", "Failed", "Aborted"})
+
+
+def get_oliver_version() -> str:
+    try:
+        return _metadata.version("stjudecloud-oliver")
+    except _metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _include_keys_to_str(include_keys: Optional[List[str]]) -> str:
+    return ",".join(sorted(include_keys or []))
+
+
+def _ensure_schema(connection: sqlite3.Connection) -> None:
+    (version,) = connection.execute("PRAGMA user_version").fetchone()
+    if version == SCHEMA_VERSION:
+        return
+
+    if version:
+        logger.info("Recreating metadata cache written with schema %d.", version)
+
+    with connection:
+        connection.execute("DROP TABLE IF EXISTS metadata")
+        connection.execute(
+            """CREATE TABLE metadata (
+                workflow_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                include_keys TEXT NOT NULL,
+                oliver_version TEXT NOT NULL,
+                fetched_at TEXT NOT NULL,
+                metadata TEXT NOT NULL,
+                PRIMARY KEY (workflow_id, status, include_keys)
+            )"""
+        )
+        connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+class MetadataCache:
+    """Persistent, on-disk cache of workflow metadata keyed by (workflow id, status).
+
+    Metadata requested with only some keys (`includeKey`) is stored separately
+    from the full metadata. Only metadata for workflows in a terminal state is
+    ever stored. Entries written by a different version of Oliver are treated
+    as cache misses.
+
+    The cache is only an optimization: if the cache file cannot be opened,
+    read, or written, a warning is logged and the cache is disabled for the
+    rest of the run rather than failing the command.
+    """
+
+    def __init__(self, cache_file: str = DEFAULT_LOCATION):
+        self.path = os.path.expanduser(cache_file)
+        self.oliver_version = get_oliver_version()
+        self.connection: Optional[sqlite3.Connection] = None
+
+        try:
+            self.connection = sqlite3.connect(self.path)
+            _ensure_schema(self.connection)
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def _disable(self, error: sqlite3.Error) -> None:
+        logger.warning("Not using the metadata cache at %s: %s", self.path, error)
+        self.close()
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def get(
+        self, workflow_id: str, status: str, include_keys: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached metadata for a workflow if it exists.
+
+        Args:
+            workflow_id (str): Cromwell-assigned UUID of the workflow.
+            status (str): Status of the workflow as reported by Cromwell.
+            include_keys (List[str], optional): the `includeKey`s the metadata
+            was requested with. Defaults to None (the full metadata).
+
+        Returns:
+            Optional[Dict]: the cached metadata or None on a cache miss.
+        """
+
+        if self.connection is None or status not in TERMINAL_STATUSES:
+            return None
+
+        try:
+            row = self.connection.execute(
+                "SELECT oliver_version, metadata FROM metadata "
+                + "WHERE workflow_id = ? AND status = ? AND include_keys = ?",
+                (workflow_id, status, _include_keys_to_str(include_keys)),
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._disable(e)
+            return None
+
+        if not row:
+            return None
+
+        oliver_version, metadata = row
+        if oliver_version != self.oliver_version:
+            logger.debug(
+                "Ignoring metadata cached by Oliver %s for %s.",
+                oliver_version,
+                workflow_id,
+            )
+            return None
+
+        return json.loads(metadata)  # type: ignore
+
+    def set(
+        self,
+        workflow_id: str,
+        metadata: Dict[str, Any],
+        include_keys: Optional[List[str]] = None,
+    ) -> None:
+        """Store the metadata for a workflow if the workflow is in a terminal state.
+
+        Args:
+            workflow_id (str): Cromwell-assigned UUID of the workflow.
+            metadata (Dict): Metadata returned from the API call.
+            include_keys (List[str], optional): the `includeKey`s the metadata
+            was requested with. Defaults to None (the full metadata).
+        """
+
+        status = metadata.get("status")
+        if self.connection is None or status not in TERMINAL_STATUSES:
+            return
+
+        try:
+            with self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        workflow_id,
+                        status,
+                        _include_keys_to_str(include_keys),
+                        self.oliver_version,
+                        datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                        json.dumps(metadata),
+                    ),
+                )
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def clear(self) -> int:
+        """Remove all entries from the cache.
+
+        Returns:
+            int: the number of entries removed.
+        """
+
+        if self.connection is None:
+            errors.report(f"Unable to open the metadata cache at {self.path}.")
+            return 0
+
+        try:
+            with self.connection:
+                cursor = self.connection.execute("DELETE FROM metadata")
+        except sqlite3.Error as e:
+            errors.report(f"Unable to clear the metadata cache at {self.path}: {e}")
+            return 0
+
+        return cursor.rowcount
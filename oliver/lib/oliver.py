@@ -10,13 +10,8 @@ def get_oliver_name(workflow: Dict[str, Any]) -> str:
         workflow (Dict): Workflow returned from the API call.
     """
 
-    if "labels" in workflow:
-        workflow_labels = cast(Dict[str, str], workflow["labels"])
-
-        if constants.OLIVER_JOB_NAME_KEY in workflow_labels:
-            return workflow_labels[constants.OLIVER_JOB_NAME_KEY]
-
-    return "<not set>"
+    workflow_labels = cast(Dict[str, str], workflow.get("labels") or {})
+    return workflow_labels.get(constants.OLIVER_JOB_NAME_KEY, "<not set>")
 
 
 def get_oliver_group(workflow: Dict[str, Any]) -> str:
@@ -26,10 +21,5 @@ def get_oliver_group(workflow: Dict[str, Any]) -> str:
         workflow (Dict): Workflow returned from the API call.
     """
 
-    if "labels" in workflow:
-        workflow_labels = cast(Dict[str, str], workflow["labels"])
-
-        if constants.OLIVER_JOB_GROUP_KEY in workflow_labels:
-            return workflow_labels[constants.OLIVER_JOB_GROUP_KEY]
-
-    return "<not set>"
+    workflow_labels = cast(Dict[str, str], workflow.get("labels") or {})
+    return workflow_labels.get(constants.OLIVER_JOB_GROUP_KEY, "<not set>")
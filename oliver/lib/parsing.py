@@ -127,3 +127,50 @@ def parse_cmdline_arg(arg: str) -> Tuple[str, str, Dict[str, Any]]:
             )
 
     return arg_type, source_type, result
+
+
+def parse_batch_file(batch_file: str) -> List[Dict[str, Any]]:
+    """Parse a JSON lines file where each line holds the inputs for one workflow.
+
+    Args:
+        batch_file (str): Path to the JSON lines file. Blank lines are ignored.
+
+    Returns:
+        List[Dict[str, Any]]: Inputs for each workflow in the batch.
+    """
+
+    if not os.path.isfile(batch_file):
+        errors.report(
+            f"Batch file is not a valid file: {batch_file}.",
+            fatal=True,
+            exitcode=errors.ERROR_INVALID_INPUT,
+        )
+
+    results = []
+
+    with open(batch_file, "r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                inputs = json.loads(line)
+            except json.JSONDecodeError:
+                inputs = None
+
+            if not isinstance(inputs, dict):
+                errors.report(
+                    f"Line {lineno} of {batch_file} is not a JSON object.",
+                    fatal=True,
+                    exitcode=errors.ERROR_INVALID_INPUT,
+                )
+            results.append(inputs)
+
+    if not results:
+        errors.report(
+            f"No workflow inputs found in {batch_file}.",
+            fatal=True,
+            exitcode=errors.ERROR_INVALID_INPUT,
+        )
+
+    return results
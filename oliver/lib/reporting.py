@@ -2,7 +2,7 @@ from collections import OrderedDict
 
 from typing import Any, Dict, List, Optional, Union
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from logzero import logger
 from tzlocal import get_localzone
 import pendulum
@@ -24,10 +24,32 @@ DEFAULT_HEADER_ORDER = [
 
 DEFAULT_GRID_STYLE = "fancy_grid"
 
+LOCAL_TZ = get_localzone()
+
+
+def parse_date(given_date: str) -> pendulum.DateTime:
+    "Parses any date that is parsable by pendulum."
+    try:
+        # fast path for the ISO-8601 timestamps returned by Cromwell.
+        return pendulum.instance(
+            datetime.fromisoformat(given_date.replace("Z", "+00:00"))
+        )
+    except ValueError:
+        return pendulum.parse(given_date)
+
 
 def localize_date(given_date: str) -> str:
     "Returns a localized date given any date that is parsable by pendulum."
-    return pendulum.parse(given_date).in_tz(get_localzone()).to_day_datetime_string()
+    return parse_date(given_date).in_tz(LOCAL_TZ).to_day_datetime_string()
+
+
+def localize_dates(given_dates: List[Optional[str]], fill: str = "") -> List[str]:
+    """Returns localized dates for a column of dates parsable by pendulum.
+
+    Missing dates are replaced with `fill`.
+    """
+
+    return [localize_date(d) if d else fill for d in given_dates]
 
 
 def localize_date_from_timestamp(
@@ -37,13 +59,13 @@ def localize_date_from_timestamp(
 
     tz = "UTC"
     if already_localized:
-        tz = get_localzone()
+        tz = LOCAL_TZ
 
     logger.debug("Converting using timezone: %s", tz)
 
     return (
         pendulum.from_timestamp(timestamp, tz=tz)
-        .in_tz(get_localzone())
+        .in_tz(LOCAL_TZ)
         .to_day_datetime_string()
     )
 
@@ -1,10 +1,17 @@
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
-import pendulum
 from logzero import logger
 
-from . import api, batch, constants
+from . import api, batch, cache, constants, reporting
+
+_JOB_NAME_PREFIX = constants.OLIVER_JOB_NAME_KEY + ":"
+_JOB_GROUP_PREFIX = constants.OLIVER_JOB_GROUP_KEY + ":"
+
+
+def _submission_timestamp(workflow: Dict[str, Any]) -> float:
+    submission = workflow.get("submission")
+    return reporting.parse_date(submission).timestamp() if submission else 0
 
 
 # pylint: disable=too-many-arguments,too-many-locals
@@ -116,32 +123,35 @@ async def get_workflows(
 
     labels = []
     if oliver_job_name:
-        labels.append(f"{constants.OLIVER_JOB_NAME_KEY}:{oliver_job_name}")
+        labels.append(_JOB_NAME_PREFIX + oliver_job_name)
 
     if oliver_job_group_name:
-        labels.append(f"{constants.OLIVER_JOB_GROUP_KEY}:{oliver_job_group_name}")
+        labels.append(_JOB_GROUP_PREFIX + oliver_job_group_name)
 
     submission = None
     if isinstance(submission_time_hours_ago, int) and submission_time_hours_ago > 0:
+        # Cromwell expects UTC, so the cutoff must not be computed in local time.
         submission = (
-            datetime.datetime.now()
+            datetime.datetime.now(datetime.timezone.utc)
             - datetime.timedelta(hours=submission_time_hours_ago)
-        ).replace(microsecond=0).isoformat("T") + "Z"
+        ).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    # batch numbers are computed across all matching workflows, so statuses can
+    # only be filtered by Cromwell when we aren't batching. Otherwise, they are
+    # filtered along with the batches.
+    filter_statuses_on_server = batches is None
 
     workflows = await cromwell.get_workflows_query(
         includeSubworkflows=False,
+        additionalQueryResultFields=["labels"],
         labels=labels,
         ids=[cromwell_workflow_uuid] if cromwell_workflow_uuid else None,
         names=[cromwell_workflow_name] if cromwell_workflow_name else None,
+        statuses=statuses if filter_statuses_on_server else None,
         submission=submission,
     )
 
-    workflows = sorted(
-        workflows,
-        key=lambda k: pendulum.parse(k.get("submission", "")).timestamp()
-        if "submission" in k
-        else 0,
-    )
+    workflows = sorted(workflows, key=_submission_timestamp)
 
     if batches is not None:
         workflows = batch.get_workflow_batches(
@@ -149,15 +159,61 @@ async def get_workflows(
             batches,
             batch_interval_mins=batch_interval_mins,
             relative=relative_batching,
+            statuses=statuses,
         )
 
-    if statuses:
-        workflows = list(filter(lambda x: x["status"] in statuses, workflows))
-
     logger.info("Found %d eligible workflows given search criteria.", len(workflows))
     return workflows
 
 
+async def get_metadatas(
+    cromwell: api.CromwellAPI,
+    workflows: List[Dict[str, Any]],
+    include_keys: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Get the metadata for each of the given workflows.
+
+    Metadata for workflows in a terminal state is read from (and written to)
+    the on-disk metadata cache, so only workflows which are still in progress
+    or have not been seen before are requested from Cromwell.
+
+    Args:
+        cromwell (api.CromwellAPI): cromwell api connected to the cromwell
+        instance in question.
+
+        workflows (List[Dict]): workflows as returned from `get_workflows`.
+
+        include_keys (List[str], optional): only request these metadata keys
+        from Cromwell. This can drastically reduce the size of the response
+        for workflows with many calls. Defaults to None (all keys).
+
+    Returns:
+        Dict[str, Dict]: metadata of each workflow indexed by workflow id.
+    """
+
+    metadata_cache = cache.MetadataCache()
+
+    try:
+        metadatas = {}
+        for w in workflows:
+            cached = metadata_cache.get(w["id"], w.get("status", ""), include_keys)
+            if cached is not None:
+                metadatas[w["id"]] = cached
+
+        logger.info("Found %d workflow metadata(s) in the cache.", len(metadatas))
+        fetched = await cromwell.get_workflows_metadata_many(
+            [w["id"] for w in workflows if w["id"] not in metadatas],
+            includeKey=include_keys,
+        )
+        for workflow_id, metadata in fetched.items():
+            metadata_cache.set(workflow_id, metadata, include_keys)
+        metadatas.update(fetched)
+    finally:
+        metadata_cache.close()
+
+    return {w["id"]: metadatas[w["id"]] for w in workflows}
+
+
 async def get_outputs(
     cromwell: api.CromwellAPI, cromwell_workflow_uuid: str
 ) -> Dict[str, Any]:
@@ -23,16 +23,7 @@ async def call(args: Dict[str, Any], cromwell: api.CromwellAPI) -> None:
             reporting.print_dicts_as_table(results)
         return
 
-    batches = None
-    relative = None
-
-    if args.get("batches_relative"):
-        batches = args.get("batches_relative")
-        relative = True
-    elif args.get("batches_absolute"):
-        batches = args.get("batches_absolute")
-        relative = False
-
+    batches, relative = _args.get_batches(args)
     workflows = await _workflows.get_workflows(
         cromwell=cromwell,
         oliver_job_name=args["job_name"],
@@ -5,7 +5,7 @@ import argparse
 from typing import Any, Dict, List
 
 from collections import defaultdict
-from logzero import logger
+from operator import itemgetter
 
 from ..lib import (
     api,
@@ -27,21 +27,11 @@ async def call(args: Dict[str, Any], cromwell: api.CromwellAPI) -> None:
         args (Dict): Arguments parsed from the command line.
     """
 
-    batches = True
-    relative = None
-
-    batches_relative = args.get("batches_relative")
-    batches_absolute = args.get("batches_absolute")
-    if batches_relative:
-        batches = batches_relative
-        relative = True
-    elif batches_absolute:
-        batches = batches_absolute
-        relative = False
-
+    batches, relative = _args.get_batches(args)
     workflows = await _workflows.get_workflows(
         cromwell,
-        batches=batches,
+        # show all batches unless specific ones were requested.
+        batches=True if batches is None else batches,
         relative_batching=relative,
         batch_interval_mins=args.get("batch_interval_mins"),
     )
@@ -53,15 +43,6 @@ async def call(args: Dict[str, Any], cromwell: api.CromwellAPI) -> None:
 
     results = []
 
-    # pylint: disable=logging-not-lazy
-    if args.get("show_oliver_job_groups"):
-        logger.warning(
-            "You specified you'd like to see job group names. "
-            + "This significantly increases runtime due to the need to query metadata about each workflow. "
-            + "This may take a while!"
-        )
-    # pylint: enable=logging-not-lazy
-
     for batch_num, batch_workflows in aggregation.items():
         r = {"Batch": batch_num, "# of Jobs": len(batch_workflows)}
 
@@ -75,18 +56,10 @@ async def call(args: Dict[str, Any], cromwell: api.CromwellAPI) -> None:
         )
 
         # job groups
+        # job group labels are included in the query results.
         if args.get("show_oliver_job_groups"):
-            metadatas = {
-                w.get("id"): await cromwell.get_workflows_metadata(w.get("id"))
-                for w in batch_workflows
-            }
             r["Job Groups"] = ", ".join(
-                list(
-                    {
-                        oliver.get_oliver_group(metadatas.get(x.get("id"), {}))
-                        for x in batch_workflows
-                    }
-                )
+                list({oliver.get_oliver_group(x) for x in batch_workflows})
             )
 
         # start time
@@ -97,7 +70,9 @@ async def call(args: Dict[str, Any], cromwell: api.CromwellAPI) -> None:
             # list is empty
             r["Start Time"] = "Not yet started"
         else:
-            _sorted_workflows = sorted(batch_workflows_with_times, key=lambda x: x.get("start"))  # type: ignore
+            _sorted_workflows = sorted(
+                batch_workflows_with_times, key=itemgetter("start")
+            )
             earliest_start_time = min(x.get("start") for x in _sorted_workflows)
             r["Start Time"] = reporting.localize_date(earliest_start_time)
 
@@ -133,7 +108,7 @@ def register_subparser(
     subcommand.add_argument(
         "-g",
         "--show-oliver-job-groups",
-        help="Show oliver job groups per batch (dramatically increases runtime).",
+        help="Show oliver job groups per batch.",
         default=False,
         action="store_true",
     )
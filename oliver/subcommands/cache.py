@@ -0,0 +1,55 @@
+"""Manage Oliver's on-disk cache of workflow metadata.
+"""
+
+import argparse
+
+from typing import Any, Dict
+
+from ..lib import api, cache as _cache, errors
+
+
+async def call(
+    args: Dict[str, Any], cromwell: api.CromwellAPI  # pylint: disable=unused-argument
+) -> None:
+    """Execute the subcommand.
+
+    Args:
+        args (Dict): Arguments parsed from the command line.
+    """
+
+    metadata_cache = _cache.MetadataCache()
+
+    try:
+        if args["action"] == "clear":
+            removed = metadata_cache.clear()
+            print(f"Removed {removed} entries from {metadata_cache.path}.")
+        else:
+            errors.report(
+                f"Unhandled action: {args['action']}",
+                fatal=True,
+                exitcode=errors.ERROR_INVALID_INPUT,
+            )
+    finally:
+        metadata_cache.close()
+
+
+def register_subparser(
+    subparser: argparse._SubParsersAction,  # pylint: disable=protected-access
+) -> argparse.ArgumentParser:
+    """Registers a subparser for the current command.
+
+    Args:
+        subparser (argparse._SubParsersAction): Subparsers action.
+    """
+
+    subcommand = subparser.add_parser(
+        "cache",
+        help=__doc__.split("\n", maxsplit=1)[0],
+    )
+    subcommand.add_argument(
+        "action",
+        choices=["clear"],
+        help="Action to take on the cache.",
+    )
+    subcommand.set_defaults(func=call)
+    return subcommand
@@ -1,5 +1,6 @@
 import argparse
 
+from operator import itemgetter
 from typing import Any, Dict
 
 import pendulum
@@ -100,7 +101,7 @@ async def call(args: Dict[str, Any], cromwell: api.CromwellAPI) -> None:
 
             calls.append(result)
 
-    calls = sorted(calls, key=lambda k: k["Start"])  # type: ignore
+    calls = sorted(calls, key=itemgetter("Start"))
 
     for cur_call in calls:
         cur_call["Start"] = reporting.localize_date(cur_call["Start"])
@@ -1,8 +1,9 @@
 import argparse
 
-from typing import Any, cast, DefaultDict, Dict, List, Optional, Union
+from typing import Any, cast, Dict, List, Optional, Tuple, Union
 
-from collections import defaultdict
+from collections import Counter
+from operator import itemgetter
 
 from ..lib import (
     api,
@@ -13,6 +14,10 @@ from ..lib import (
     workflows as _workflows,
 )
 
+# the only metadata keys needed for the steps view and `--failed-calls`.
+# `status` is needed to decide whether the metadata can be cached.
+CALL_METADATA_KEYS = ["status", "executionStatus", "start"]
+
 
 async def call(args: Dict[str, Any], cromwell: api.CromwellAPI) -> None:
     """Execute the subcommand.
@@ -21,43 +26,39 @@ async def call(args: Dict[str, Any], cromwell: api.CromwellAPI) -> None:
         args (Dict): Arguments parsed from the command line.
     """
 
-    batches = None
-    relative = None
-
-    if args.get("batches_relative"):
-        batches = args.get("batches_relative")
-        relative = True
-    elif args.get("batches_absolute"):
-        batches = args.get("batches_absolute")
-        relative = False
-
+    batches, relative = _args.get_batches(args)
     workflows = await _workflows.get_workflows(
         cromwell=cromwell,
-        submission_time_hours_ago=args["submission_time"],
-        oliver_job_name=args["job_name"],
-        oliver_job_group_name=args["job_group"],
-        cromwell_workflow_uuid=args["cromwell_workflow_uuid"],
-        cromwell_workflow_name=args["cromwell_workflow_name"],
+        submission_time_hours_ago=args.get("submission_time"),
+        oliver_job_name=args.get("job_name"),
+        oliver_job_group_name=args.get("job_group"),
+        cromwell_workflow_uuid=args.get("cromwell_workflow_uuid"),
+        cromwell_workflow_name=args.get("cromwell_workflow_name"),
         batches=batches,
-        batch_interval_mins=args["batch_interval_mins"],
+        batch_interval_mins=args.get("batch_interval_mins"),
         relative_batching=relative,
-        opt_into_reporting_aborted_jobs=args["show_aborted_jobs"],
-        opt_into_reporting_failed_jobs=args["show_failed_jobs"],
-        opt_into_reporting_running_jobs=args["show_running_jobs"],
-        opt_into_reporting_succeeded_jobs=args["show_succeeded_jobs"],
+        opt_into_reporting_aborted_jobs=args.get("show_aborted_jobs", False),
+        opt_into_reporting_failed_jobs=args.get("show_failed_jobs", False),
+        opt_into_reporting_running_jobs=args.get("show_running_jobs", False),
+        opt_into_reporting_succeeded_jobs=args.get("show_succeeded_jobs", False),
     )
 
-    metadatas = {
-        w["id"]: await cromwell.get_workflows_metadata(w["id"]) for w in workflows
-    }
-
+    # the query results already include each workflow's status and labels, so
+    # metadata is only needed when we have to look at individual calls.
     call_names_to_consider = args.get("failed_calls")
+    metadatas: Dict[str, Dict[str, Any]] = {}
+    steps_view = args.get("steps_view")
+    if call_names_to_consider or steps_view:
+        metadatas = await _workflows.get_metadatas(
+            cromwell, workflows, include_keys=CALL_METADATA_KEYS
+        )
+
     if call_names_to_consider:
         new_workflows = []
         for workflow in workflows:
             keep_workflow = False
             for call_name, calls in (
-                metadatas.get(workflow.get("id"), {}).get("calls", {}).items()
+                metadatas.get(workflow["id"], {}).get("calls", {}).items()
             ):
                 if call_name in call_names_to_consider:
                     # pylint: disable=R1729
@@ -70,18 +71,14 @@ async def call(args: Dict[str, Any], cromwell: api.CromwellAPI) -> None:
 
         workflows = new_workflows
 
-    if args.get("steps_view"):
+    if steps_view:
         print_workflow_steps_view(
             workflows, metadatas, grid_style=args.get("grid_style")
         )
     elif args.get("detail_view"):
-        print_workflow_detail_view(
-            workflows,
-            metadatas,
-            grid_style=args["grid_style"],
-        )
+        print_workflow_detail_view(workflows, grid_style=args.get("grid_style"))
     else:
-        print_workflow_summary(workflows, metadatas, grid_style=args["grid_style"])
+        print_workflow_summary(workflows, grid_style=args.get("grid_style"))
 
 
 def register_subparser(
@@ -186,66 +183,49 @@ def register_subparser(
 
 def print_workflow_summary(
     workflows: List[Dict[str, Any]],
-    metadatas: Dict[str, Any],
     grid_style: Optional[str] = "fancy_grid",
 ) -> None:
     """Print a summary of workflow statuses.
 
     Args:
         workflows (List): List of workflows returned from the API call.
-        metadatas (Dict): Dictionary of metadatas indexed by workflow id.
     """
 
-    agg: DefaultDict[str, DefaultDict[str, int]] = defaultdict(lambda: defaultdict(int))
+    counts = Counter((oliver.get_oliver_group(w), w["status"]) for w in workflows)
 
-    for w in workflows:
-        m = metadatas[w["id"]]
-        job_group = oliver.get_oliver_group(m)
-        agg[job_group][m["status"]] += 1
-
-    results = []
-    keys = set()
-    # pylint: disable=C0206
-    for group in agg.keys():
-        for k in agg[group]:
-            keys.add(k)
-        obj: Dict[str, Union[str, int]] = {"Job Group": group}
-        obj.update(agg[group])
-        results.append(obj)
-
-    for r in results:
-        for k in keys:
-            if not k in r:
-                r[k] = 0
+    # dicts are used as ordered sets so the columns come out in a stable order.
+    groups = dict.fromkeys(group for group, _ in counts)
+    keys = dict.fromkeys(status for _, status in counts)
+    results: List[Dict[str, Union[str, int]]] = [
+        {"Job Group": group, **{k: counts[(group, k)] for k in keys}}
+        for group in groups
+    ]
 
     reporting.print_dicts_as_table(results, grid_style)
 
 
 def print_workflow_detail_view(
     workflows: List[Dict[str, Any]],
-    metadatas: Dict[str, Any],
-    grid_style: str = "fancy_grid",
+    grid_style: Optional[str] = "fancy_grid",
 ) -> None:
     """Print a detailed table of workflow statuses.
 
     Args:
         workflows (List): List of workflows returned from the API call.
-        metadatas (Dict): Dictionary of metadatas indexed by workflow id.
     """
 
-    results = [
-        {
-            "Job Name": oliver.get_oliver_name(metadatas.get(w.get("id", ""), {})),
-            "Job Group": oliver.get_oliver_group(metadatas.get(w.get("id", ""), {})),
+    def _row(w: Dict[str, Any], start: str) -> Dict[str, str]:
+        return {
+            "Job Name": oliver.get_oliver_name(w),
+            "Job Group": oliver.get_oliver_group(w),
             "Workflow ID": w.get("id", ""),
             "Workflow Name": w.get("name", ""),
             "Status": w.get("status", ""),
-            "Start": reporting.localize_date(w.get("start", ""))
-            if "start" in w
-            else "",
+            "Start": start,
         }
-        for w in workflows
-    ]
+
+    starts = reporting.localize_dates([w.get("start") for w in workflows])
+    results = [_row(w, start) for w, start in zip(workflows, starts)]
 
     reporting.print_dicts_as_table(results, grid_style)
 
@@ -262,7 +242,7 @@ def print_workflow_steps_view(
         metadatas (Dict): Dictionary of metadatas indexed by workflow id.
     """
 
-    results: DefaultDict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    steps: List[Tuple[str, str]] = []
 
     for w in workflows:
         uuid = cast(str, w.get("id", ""))
@@ -281,13 +261,12 @@ def print_workflow_steps_view(
                 exitcode=errors.ERROR_UNEXPECTED_RESPONSE,
             )
 
-        for call_name, calls in m.get("calls").items():
-            most_recent_call = sorted(calls, key=lambda x: x["start"])[-1]  # type: ignore
-            results[call_name][most_recent_call.get("executionStatus")] += 1
+        for call_name, calls in m.get("calls", {}).items():
+            most_recent_call = sorted(calls, key=itemgetter("start"))[-1]
+            steps.append((call_name, most_recent_call.get("executionStatus")))
 
-    # pylint: disable=C0206
-    _results: List[Dict[str, Union[str, int]]] = [
-        {"Call Name": call_name, **results[call_name]} for call_name in results.keys()
-    ]
+    _results: Dict[str, Dict[str, Union[str, int]]] = {}
+    for (call_name, status), count in Counter(steps).items():
+        _results.setdefault(call_name, {"Call Name": call_name})[status] = count
 
-    reporting.print_dicts_as_table(_results, grid_style)
+    reporting.print_dicts_as_table(list(_results.values()), grid_style)
@@ -4,11 +4,12 @@ Input files can be passed or inputs can be directly added via the command line.
 """
 
 import argparse
+import json
 
 from typing import Any, Dict
 
 from ..lib import api, args as _args, errors, reporting
-from ..lib.parsing import parse_workflow, parse_workflow_inputs
+from ..lib.parsing import parse_batch_file, parse_workflow, parse_workflow_inputs
 
 
 async def call(args: Dict[str, Any], cromwell: api.CromwellAPI) -> None:
@@ -42,12 +43,27 @@ async def call(args: Dict[str, Any], cromwell: api.CromwellAPI) -> None:
     )
     workflow_args["workflowDependencies"] = args.get("dependencies")
 
+    batch_file = args.get("batch_file")
+    if batch_file:
+        # inputs from the command line are shared by every workflow in the
+        # batch, and each line of the batch file is layered on top.
+        inputs = json.loads(workflow_args["workflowInputs"])
+        workflow_args["workflowInputs"] = json.dumps(
+            [
+                {**inputs, **batch_inputs}
+                for batch_inputs in parse_batch_file(batch_file)
+            ]
+        )
+
     if args.get("dry_run"):
         for key, value in workflow_args.items():
             print(f"{key} = {value}")
         return
 
-    results = [await cromwell.post_workflows(**workflow_args)]
+    if batch_file:
+        results = await cromwell.post_workflows_batch(**workflow_args)
+    else:
+        results = [await cromwell.post_workflows(**workflow_args)]
     reporting.print_dicts_as_table(results, args["grid_style"])
 
 
@@ -71,6 +87,11 @@ def register_subparser(
         help="""JSON files or key=value pairs to add to inputs, options, \
           or labels (see documentation for more information).""",
     )
+    subcommand.add_argument(
+        "--batch-file",
+        help="""JSON lines file with the inputs of one workflow per line. All of \
+          the workflows are submitted together as a single batch.""",
+    )
     subcommand.add_argument("--dependencies", help="Zip file of workflow dependencies")
     subcommand.add_argument(
         "-d",
@@ -23,6 +23,9 @@ class Timezone(_tzinfo):
     def __init__(self: Timezone, name: str, extended: bool = ...) -> None: ...
 
 def parse(text: str, **options: Any) -> DateTime: ...
+def instance(
+    dt: datetime, tz: Union[str, Timezone, _tzinfo, None] = ...
+) -> DateTime: ...
 def from_timestamp(
     timestamp: Union[int, float], tz: Union[str, Timezone] = ...
 ) -> DateTime: ...
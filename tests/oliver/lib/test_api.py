@@ -23,6 +23,51 @@ async def test_get_workflows():
     await cromwell.close()
 
 
+@pytest.mark.asyncio
+async def test_get_workflows_by_status():
+    cromwell = api.CromwellAPI(server="http://cromwell:8000", version="v1")
+
+    assert len(await cromwell.get_workflows_query(statuses=["Succeeded"])) == 5
+    assert await cromwell.get_workflows_query(statuses=["Failed", "Aborted"]) == []
+
+    await cromwell.close()
+
+
+@pytest.mark.asyncio
+async def test_get_workflows_with_labels():
+    cromwell = api.CromwellAPI(server="http://cromwell:8000", version="v1")
+    results = await cromwell.get_workflows_query(
+        additionalQueryResultFields=["labels"], includeSubworkflows=False
+    )
+
+    assert len(results) == 5
+    for result in results:
+        assert isinstance(result.get("labels"), dict)
+
+    await cromwell.close()
+
+
+@pytest.mark.asyncio
+async def test_get_workflows_metadata_many():
+    cromwell = api.CromwellAPI(server="http://cromwell:8000", version="v1")
+    ids = [w["id"] for w in await cromwell.get_workflows_query()]
+    results = await cromwell.get_workflows_metadata_many(ids)
+
+    assert list(results.keys()) == ids
+    for workflow_id, metadata in results.items():
+        assert metadata.get("id") == workflow_id
+
+    await cromwell.close()
+
+
+@pytest.mark.asyncio
+async def test_context_manager_closes_session():
+    async with api.CromwellAPI(server="http://cromwell:8000", version="v1") as cromwell:
+        assert not cromwell.session.closed
+
+    assert cromwell.session.closed
+
+
 @pytest.mark.asyncio
 async def test_api_get():
     cromwell = api.CromwellAPI(server="http://httpbin:80", version="v1")
@@ -143,10 +188,31 @@ async def test_errors_on_post_workflows_no_workflow_source():
 
 
 @pytest.mark.asyncio
-async def test_post_workflows_batch_not_implemented():
-    with pytest.raises(NotImplementedError):
-        cromwell = api.CromwellAPI(server="http://cromwell:8000", version="v1")
-        await cromwell.post_workflows_batch()
+async def test_post_workflows_batch():
+    cromwell = api.CromwellAPI(
+        server="http://httpbin:80", version="v1", route_override="/post"
+    )
+    inputs = [{"input": "foo"}, {"input": "bar"}]
+    label_dict = {"label": "baz"}
+    response = await cromwell.post_workflows_batch(
+        workflowUrl="https://foo/bar",
+        workflowInputs=inputs,
+        labels=json.dumps(label_dict),
+    )
+
+    assert json.loads(response.get("files").get("workflowInputs")) == inputs
+    assert json.loads(response.get("files").get("labels")) == label_dict
+    await cromwell.close()
+
+
+@pytest.mark.asyncio
+async def test_errors_on_post_workflows_batch_no_inputs():
+    cromwell = api.CromwellAPI(server="http://httpbin", version="v1")
+
+    with pytest.raises(SystemExit):
+        await cromwell.post_workflows_batch(workflowUrl="https://foo/bar")
+
+    await cromwell.close()
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,50 @@
+import pytest
+
+from oliver.lib import batch
+
+
+def get_workflows():
+    return [
+        {"id": "a", "status": "Failed", "submission": "2020-01-01T00:00:00.000Z"},
+        {"id": "b", "status": "Succeeded", "submission": "2020-01-01T00:01:00.000Z"},
+        {"id": "c", "status": "Failed", "submission": "2020-01-01T01:00:00.000Z"},
+        {"id": "d", "status": "Running", "submission": "2020-01-01T02:00:00.000Z"},
+    ]
+
+
+def test_batch_workflows():
+    workflows, max_batch_num = batch.batch_workflows(get_workflows())
+
+    assert [w["batch"] for w in workflows] == [0, 0, 1, 2]
+    assert max_batch_num == 2
+
+
+def test_get_workflow_batches_absolute():
+    workflows = batch.get_workflow_batches(get_workflows(), [0, 2])
+
+    assert [w["id"] for w in workflows] == ["a", "b", "d"]
+
+
+def test_get_workflow_batches_relative():
+    workflows = batch.get_workflow_batches(get_workflows(), [0], relative=True)
+
+    assert [w["id"] for w in workflows] == ["d"]
+
+
+def test_get_workflow_batches_with_statuses():
+    workflows = batch.get_workflow_batches(
+        get_workflows(), [0, 2], statuses=["Failed", "Running"]
+    )
+
+    assert [w["id"] for w in workflows] == ["a", "d"]
+
+
+def test_get_all_workflow_batches_with_statuses():
+    workflows = batch.get_workflow_batches(get_workflows(), True, statuses=["Failed"])
+
+    assert [w["id"] for w in workflows] == ["a", "c"]
+
+
+def test_get_workflow_batches_relative_out_of_range():
+    with pytest.raises(SystemExit):
+        batch.get_workflow_batches(get_workflows(), [3], relative=True)
@@ -0,0 +1,102 @@
+import sqlite3
+
+import pytest
+
+from oliver.lib import cache
+
+
+def test_cache_stores_terminal_workflows(tmp_path):
+    metadata_cache = cache.MetadataCache(str(tmp_path / "cache"))
+    metadata = {"id": "foo", "status": "Succeeded"}
+    metadata_cache.set("foo", metadata)
+
+    assert metadata_cache.get("foo", "Succeeded") == metadata
+    assert metadata_cache.get("foo", "Failed") is None
+    metadata_cache.close()
+
+
+def test_cache_separates_include_keys(tmp_path):
+    metadata_cache = cache.MetadataCache(str(tmp_path / "cache"))
+    metadata = {"id": "foo", "status": "Succeeded"}
+    metadata_cache.set("foo", metadata, ["status", "start"])
+
+    assert metadata_cache.get("foo", "Succeeded") is None
+    assert metadata_cache.get("foo", "Succeeded", ["start", "status"]) == metadata
+    metadata_cache.close()
+
+
+def test_cache_ignores_running_workflows(tmp_path):
+    metadata_cache = cache.MetadataCache(str(tmp_path / "cache"))
+    metadata_cache.set("foo", {"id": "foo", "status": "Running"})
+
+    assert metadata_cache.get("foo", "Running") is None
+    metadata_cache.close()
+
+
+def test_cache_ignores_other_oliver_versions(tmp_path):
+    metadata_cache = cache.MetadataCache(str(tmp_path / "cache"))
+    metadata_cache.set("foo", {"id": "foo", "status": "Failed"})
+    metadata_cache.oliver_version = "0.0.0"
+
+    assert metadata_cache.get("foo", "Failed") is None
+    metadata_cache.close()
+
+
+def test_cache_clear(tmp_path):
+    metadata_cache = cache.MetadataCache(str(tmp_path / "cache"))
+    metadata_cache.set("foo", {"id": "foo", "status": "Aborted"})
+    metadata_cache.set("bar", {"id": "bar", "status": "Succeeded"})
+
+    assert metadata_cache.clear() == 2
+    assert metadata_cache.get("foo", "Aborted") is None
+    metadata_cache.close()
+
+
+def test_cache_disabled_when_unavailable(tmp_path):
+    metadata_cache = cache.MetadataCache(str(tmp_path / "missing" / "cache"))
+    metadata_cache.set("foo", {"id": "foo", "status": "Succeeded"})
+
+    assert metadata_cache.connection is None
+    assert metadata_cache.get("foo", "Succeeded") is None
+    metadata_cache.close()
+
+
+def test_cache_disabled_after_error(tmp_path):
+    metadata_cache = cache.MetadataCache(str(tmp_path / "cache"))
+    metadata_cache.connection.execute("DROP TABLE metadata")
+    metadata_cache.set("foo", {"id": "foo", "status": "Succeeded"})
+
+    assert metadata_cache.connection is None
+    assert metadata_cache.get("foo", "Succeeded") is None
+    metadata_cache.close()
+
+
+def test_cache_clear_reports_unavailable(tmp_path):
+    metadata_cache = cache.MetadataCache(str(tmp_path / "missing" / "cache"))
+
+    with pytest.raises(SystemExit):
+        metadata_cache.clear()
+
+
+@pytest.mark.parametrize("user_version", [0, 1])
+def test_cache_recreates_older_schemas(tmp_path, user_version):
+    connection = sqlite3.connect(tmp_path / "cache")
+    connection.execute(
+        """CREATE TABLE metadata (
+            workflow_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            oliver_version TEXT NOT NULL,
+            fetched_at TEXT NOT NULL,
+            metadata TEXT NOT NULL,
+            PRIMARY KEY (workflow_id, status)
+        )"""
+    )
+    connection.execute(f"PRAGMA user_version = {user_version}")
+    connection.close()
+
+    metadata_cache = cache.MetadataCache(str(tmp_path / "cache"))
+    metadata = {"id": "foo", "status": "Succeeded"}
+    metadata_cache.set("foo", metadata, ["status"])
+
+    assert metadata_cache.get("foo", "Succeeded", ["status"]) == metadata
+    metadata_cache.close()
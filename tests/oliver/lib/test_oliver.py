@@ -0,0 +1,19 @@
+from oliver.lib import constants, oliver
+
+
+def test_get_oliver_name_and_group():
+    workflow = {
+        "labels": {
+            constants.OLIVER_JOB_NAME_KEY: "foo",
+            constants.OLIVER_JOB_GROUP_KEY: "bar",
+        }
+    }
+
+    assert oliver.get_oliver_name(workflow) == "foo"
+    assert oliver.get_oliver_group(workflow) == "bar"
+
+
+def test_get_oliver_name_and_group_not_set():
+    for workflow in [{}, {"labels": {}}, {"labels": None}]:
+        assert oliver.get_oliver_name(workflow) == "<not set>"
+        assert oliver.get_oliver_group(workflow) == "<not set>"
@@ -0,0 +1,35 @@
+import pytest
+
+from oliver.lib import parsing
+
+
+def test_parse_batch_file(tmp_path):
+    batch_file = tmp_path / "batch.jsonl"
+    batch_file.write_text('{"sample": "foo"}\n\n{"sample": "bar"}\n')
+
+    assert parsing.parse_batch_file(str(batch_file)) == [
+        {"sample": "foo"},
+        {"sample": "bar"},
+    ]
+
+
+def test_parse_batch_file_invalid_line(tmp_path):
+    batch_file = tmp_path / "batch.jsonl"
+    batch_file.write_text('{"sample": "foo"}\n["bar"]\n')
+
+    with pytest.raises(SystemExit):
+        parsing.parse_batch_file(str(batch_file))
+
+
+def test_parse_batch_file_empty(tmp_path):
+    batch_file = tmp_path / "batch.jsonl"
+    batch_file.write_text("\n")
+
+    with pytest.raises(SystemExit):
+        parsing.parse_batch_file(str(batch_file))
+
+
+@pytest.mark.parametrize("name", ["missing.jsonl", ""])
+def test_parse_batch_file_not_a_file(tmp_path, name):
+    with pytest.raises(SystemExit):
+        parsing.parse_batch_file(str(tmp_path / name))
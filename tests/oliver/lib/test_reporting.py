@@ -0,0 +1,20 @@
+from unittest.mock import patch
+
+import pendulum
+
+from oliver.lib import reporting
+
+
+@patch("oliver.lib.reporting.LOCAL_TZ", pendulum.timezone("UTC"))
+def test_localize_dates():
+    assert reporting.localize_dates(
+        ["2020-01-01T12:30:00.000Z", None, "2020-06-15T09:05:01.12Z"]
+    ) == ["Wed, Jan 1, 2020 12:30 PM", "", "Mon, Jun 15, 2020 9:05 AM"]
+
+
+def test_parse_date():
+    expected = pendulum.datetime(2020, 1, 1, 12, 30, 0, 120000)
+
+    assert reporting.parse_date("2020-01-01T12:30:00.12Z") == expected
+    assert reporting.parse_date("2020-01-01T12:30:00.120Z") == expected
+    assert reporting.parse_date("2020-01-01T07:30:00.120-05:00") == expected